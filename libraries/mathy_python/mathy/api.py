@@ -15,6 +15,7 @@ class Mathy:
     """The standard interface for working with Mathy models and agents."""
 
     state: MathyAPISwarmState
+    silent: bool
 
     def __init__(
         self,
@@ -27,8 +28,11 @@ class Mathy:
         if not isinstance(config, SwarmConfig):
             raise ValueError("config must be a SwarmConfig instance")
         self.state = MathyAPISwarmState(config=config)
+        self.silent = silent
 
     def simplify(self, *, problem: str, max_steps: Optional[int] = None) -> Swarm:
         if max_steps is not None:
-            return swarm_solve(problem, self.state.config, max_steps=max_steps)
-        return swarm_solve(problem, self.state.config)
+            return swarm_solve(
+                problem, self.state.config, max_steps=max_steps, silent=self.silent
+            )
+        return swarm_solve(problem, self.state.config, silent=self.silent)
@@ -48,8 +48,22 @@ def cli_contribute():
     default=512,
     help="The max number of steps before the episode is over",
 )
+@click.option(
+    "num_workers",
+    "--num-workers",
+    default=8,
+    type=click.IntRange(min=1),
+    help="The number of processes used to step the swarm environments "
+    "(ignored with --single-process)",
+)
 @click.argument("problem", type=str)
-def cli_simplify(problem: str, max_steps: int, single_process: bool, num_walkers: int):
+def cli_simplify(
+    problem: str,
+    max_steps: int,
+    single_process: bool,
+    num_walkers: int,
+    num_workers: int,
+):
     """Simplify an input polynomial expression."""
 
     from .api import Mathy
@@ -57,7 +71,10 @@ def cli_simplify(problem: str, max_steps: int, single_process: bool, num_walkers
 
     mt = Mathy(
         config=SwarmConfig(
-            use_mp=not single_process, n_walkers=num_walkers, verbose=True
+            use_mp=not single_process,
+            n_walkers=num_walkers,
+            n_workers=num_workers,
+            verbose=True,
         )
     )
     mt.simplify(problem=problem, max_steps=max_steps)
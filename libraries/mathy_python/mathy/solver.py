@@ -11,12 +11,13 @@ from fragile.core.tree import HistoryTree
 from fragile.distributed.env import ParallelEnv
 from mathy_core import MathTypeKeysMax
 from mathy_envs import EnvRewards, MathyEnv, MathyEnvState
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt
 from wasabi import msg
 
 
 class SwarmConfig(BaseModel):
     use_mp: bool = True
+    n_workers: PositiveInt = 8
     history: bool = False
     history_names: List[str] = ["states", "actions", "rewards"]
     single_problem: bool = False
@@ -29,6 +30,19 @@ def mathy_dist(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     return np.linalg.norm(x - y, axis=1)
 
 
+def random_choice_prob_index(
+    random_state: np.random.RandomState, a: np.ndarray, axis: int = 1
+) -> np.ndarray:
+    """Select random actions with probabilities across a batch.
+
+    Samples by inverse CDF (cumsum + one uniform draw per row) rather than
+    calling np.random.choice once per row.
+
+    Source: https://stackoverflow.com/a/47722393/287335"""
+    r = np.expand_dims(random_state.rand(a.shape[1 - axis]), axis=axis)
+    return (a.cumsum(axis=axis) > r).argmax(axis=axis)
+
+
 class DiscreteMasked(DiscreteModel):
     def sample(
         self,
@@ -38,19 +52,12 @@ class DiscreteMasked(DiscreteModel):
         walkers_states: StatesWalkers = None,
         **kwargs,
     ) -> StatesModel:
-        def random_choice_prob_index(a, axis=1):
-            """Select random actions with probabilities across a batch.
-            
-            Source: https://stackoverflow.com/a/47722393/287335"""
-            r = np.expand_dims(self.random_state.rand(a.shape[1 - axis]), axis=axis)
-            return (a.cumsum(axis=axis) > r).argmax(axis=axis)
-
         if env_states is not None:
             # Each state is a vstack([node_ids, mask]) and we only want the mask.
             #
             # Swap columns and slice the last element to get it.
             masks = env_states.observs[:, -self.n_actions :]
-            actions = random_choice_prob_index(masks)
+            actions = random_choice_prob_index(self.random_state, masks)
         else:
             actions = self.random_state.randint(0, self.n_actions, size=batch_size)
         return self.update_states_with_critic(
@@ -101,13 +108,15 @@ class FragileMathyEnv(DiscreteEnv):
         new_states, observs, rewards, oobs, infos = self._env.step_batch(
             actions=actions, states=states
         )
-        terminals = [inf.get("done", False) for inf in infos]
+        terminals = np.fromiter(
+            (inf.get("done", False) for inf in infos), dtype=bool, count=len(infos)
+        )
         data = {
             "states": np.array(new_states),
             "observs": np.array(observs),
             "rewards": np.array(rewards),
             "oobs": np.array(oobs),
-            "terminals": np.array(terminals),
+            "terminals": terminals,
         }
         return data
 
@@ -189,7 +198,9 @@ def mathy_swarm(config: SwarmConfig, env_callable=None) -> Swarm:
             name="mathy_v0", repeat_problem=config.single_problem
         )
     if config.use_mp:
-        env_callable = ParallelEnv(env_callable=env_callable)
+        env_callable = ParallelEnv(
+            env_callable=env_callable, n_workers=config.n_workers
+        )
     tree_callable = None
     if config.history:
         tree_callable = lambda: HistoryTree(prune=True, names=config.history_names)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from mathy.api import Mathy, MathyAPISwarmState
 
@@ -9,3 +11,16 @@ def test_api_mathy_constructor():
     # Config must be a known pydantic config
     with pytest.raises(ValueError):
         Mathy(config={})  # type:ignore
+
+
+def test_api_mathy_silent():
+    mt = Mathy(silent=True)
+    with patch("mathy.api.swarm_solve") as solve_mock:
+        mt.simplify(problem="4x+2x")
+        _, kwargs = solve_mock.call_args
+        assert kwargs["silent"] is True
+
+        mt.simplify(problem="4x+2x", max_steps=3)
+        _, kwargs = solve_mock.call_args
+        assert kwargs["silent"] is True
+        assert kwargs["max_steps"] == 3
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 from click.testing import CliRunner
 from mathy.cli import cli
+from mathy.solver import SwarmConfig, mathy_swarm
 from mathy_envs.env import MathyEnv
 from mathy_envs.gym import MathyGymEnv
 from mathy_envs.gym.mathy_gym_env import safe_register
@@ -65,3 +66,29 @@ def test_cli_simplify_swarm(use_mp: bool):
         args.append("--single-process")
     result = runner.invoke(cli, args)
     assert result.exit_code == 0
+
+
+def test_cli_simplify_num_workers():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["simplify", "4x + 2x", "--num-workers=2"])
+    assert result.exit_code == 0
+
+
+def test_cli_simplify_num_workers_invalid():
+    runner = CliRunner()
+    for value in ["0", "-1"]:
+        result = runner.invoke(cli, ["simplify", "4x + 2x", f"--num-workers={value}"])
+        assert result.exit_code != 0
+        assert "num-workers" in result.output
+
+
+def test_swarm_config_n_workers():
+    with patch("mathy.solver.ParallelEnv") as env_mock:
+        with patch("mathy.solver.Swarm"):
+            mathy_swarm(SwarmConfig(n_workers=3))
+    _, kwargs = env_mock.call_args
+    assert kwargs["n_workers"] == 3
+
+    # Must be a positive number of processes
+    with pytest.raises(ValueError):
+        SwarmConfig(n_workers=0)
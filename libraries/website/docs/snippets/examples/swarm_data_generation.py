@@ -20,8 +20,7 @@ total_generated = 0
 for states, actions, rewards in random_batches:
     texts = [MathyEnvState.from_np(s).agent.problem for s in states]
     total_generated += len(texts)
-    unique = list(set(texts))
-    total_set.update(unique)
+    total_set.update(texts)
 best_state = MathyEnvState.from_np(swarm.walkers.states.best_state)
 swarm.env._env._env.mathy.print_history(best_state)
 print(f"Generated {total_generated} states, {len(total_set)} of which are unique")